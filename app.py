@@ -1,35 +1,73 @@
 import os
-import json
+import gzip
+import re
+import unicodedata
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import streamlit as st
-from langchain_google_genai import ChatGoogleGenerativeAI
 from dotenv import load_dotenv
-from textblob import TextBlob
-from googletrans import Translator
 
-# Load API Key from .env
-load_dotenv()
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+# Load API Key from .env (parsed once per process, not on every rerun)
+@lru_cache(maxsize=1)
+def _api_key():
+    load_dotenv()
+    return os.getenv("GEMINI_API_KEY")
 
-# Initialize the LLM
-llm = ChatGoogleGenerativeAI(model="gemini-1.5-flash", google_api_key=GEMINI_API_KEY)
+# Initialize the LLM once per process and share it across reruns and sessions
+# (heavy client libraries are imported on first use, not before the first paint)
+@st.cache_resource
+def get_llm():
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    return ChatGoogleGenerativeAI(model="gemini-1.5-flash", google_api_key=_api_key())
 
-# Translator for multilingual support
-translator = Translator()
+# Translator for multilingual support (single client, so its HTTP/2 connection pool is reused)
+@st.cache_resource
+def get_translator():
+    from googletrans import Translator
+    return Translator(http2=True)
 
-# JSON file path
-DATA_FILE = "candidate_data.json"
+# Gzip-compressed JSON Lines file path (one candidate record per line)
+DATA_FILE = "candidate_data.jsonl.gz"
+# Pre-JSON Lines data file, imported once and then renamed out of the way
+LEGACY_DATA_FILE = "candidate_data.json"
 
-# Function to load existing data from JSON
+# One-time import of candidates saved by older versions in a single JSON document
+def migrate_legacy_data():
+    if not os.path.exists(LEGACY_DATA_FILE):
+        return
+    with open(LEGACY_DATA_FILE, "rb") as f:
+        legacy_data = orjson.loads(f.read())
+    # Legacy records go first so anything already appended to the new file still wins on load
+    migrated = gzip.compress(b"".join(orjson.dumps(record) + b"\n" for record in legacy_data.values()), compresslevel=1)
+    if os.path.exists(DATA_FILE):
+        with open(DATA_FILE, "rb") as f:
+            migrated += f.read()
+    with open(DATA_FILE + ".tmp", "wb") as f:
+        f.write(migrated)
+    os.replace(DATA_FILE + ".tmp", DATA_FILE)
+    os.replace(LEGACY_DATA_FILE, LEGACY_DATA_FILE + ".migrated")
+
+# Parse the JSON Lines file, keyed by email (later records win); cached for the latest file mtime only
+@st.cache_data(show_spinner=False, max_entries=1)
+def _load_data_cached(mtime):
+    with gzip.open(DATA_FILE, "rb") as f:
+        records = (orjson.loads(line) for line in f if line.strip())
+        return {record["info"]["email"]: record for record in records}
+
+# Function to load existing data, reparsing only when the file has changed
 def load_data():
+    migrate_legacy_data()
     if os.path.exists(DATA_FILE):
-        with open(DATA_FILE, "r") as f:
-            return json.load(f)
+        return _load_data_cached(os.path.getmtime(DATA_FILE))
     return {}
 
-# Function to save data to JSON
-def save_data(data):
-    with open(DATA_FILE, "w") as f:
-        json.dump(data, f, indent=4)
+# Function to append a single candidate record without rewriting the whole file
+# (each append adds a gzip member; level 1 keeps compression cost negligible)
+def append_candidate(record):
+    migrate_legacy_data()
+    with gzip.open(DATA_FILE, "ab", compresslevel=1) as f:
+        f.write(orjson.dumps(record) + b"\n")
 
 # Streamlit UI Configuration
 st.set_page_config(page_title="TalentScout - Hiring Assistant", layout="centered")
@@ -51,26 +89,158 @@ if "interview_started" not in st.session_state:
     st.session_state.interview_started = False
 if "current_answer" not in st.session_state:
     st.session_state.current_answer = ""
+if "interview_saved" not in st.session_state:
+    st.session_state.interview_saved = False
+if "tr_cache" not in st.session_state:
+    st.session_state.tr_cache = {}
 
 # Language Selection (Added Tamil)
 lang_options = {"English": "en", "Telugu": "te", "Hindi": "hi", "Tamil": "ta"}
 selected_lang = st.selectbox("🌍 Select your preferred language:", list(lang_options.keys()))
 st.session_state.preferred_language = lang_options[selected_lang]
 
-# Translation Function
-def translate_text(text, target_lang="en"):
-    if target_lang == "en":
-        return text
+# Translation API call for a batch of unique strings (cached so each batch is only sent once per language)
+@st.cache_data(show_spinner=False, max_entries=4096)
+def _translate_batch(texts, target_lang):
+    translated = get_translator().translate(texts, dest=target_lang)
+    return [t.text for t in translated]
+
+# Unicode script names for the non-English languages on offer
+LANGUAGE_SCRIPTS = {"te": "TELUGU", "hi": "DEVANAGARI", "ta": "TAMIL"}
+
+# Cheap check for text that is already written in the target language's script
+def is_in_language_script(text, target_lang):
+    script = LANGUAGE_SCRIPTS.get(target_lang)
+    letters = [ch for ch in text[:50] if ch.isalpha()]
+    if script is None or not letters:
+        return False
+    in_script = sum(1 for ch in letters if unicodedata.name(ch, "").startswith(script))
+    # Most letters already in the target script: treat embedded English terms as untranslatable
+    return in_script * 2 > len(letters)
+
+# Translation Functions
+def translate_many(texts, target_lang="en"):
+    texts = list(texts)
+    if target_lang == "en" or not texts:
+        return texts
+    # Only send strings this session hasn't translated yet, each one once
+    cache = st.session_state.tr_cache
+    missing = []
+    for text in dict.fromkeys(texts):
+        if (text, target_lang) in cache:
+            continue
+        if not text.strip() or is_in_language_script(text, target_lang):
+            cache[(text, target_lang)] = text
+        else:
+            missing.append(text)
+    if missing:
+        try:
+            translated = _translate_batch(missing, target_lang)
+        except Exception:
+            return texts
+        cache.update(zip(((text, target_lang) for text in missing), translated))
+    return [cache[(text, target_lang)] for text in texts]
+
+def translate_text(text: str, target_lang: str = "en") -> str:
+    return translate_many([text], target_lang)[0]
+
+# Fixed UI strings, translated together once per language
+STATIC_STRINGS = {
+    "candidate_information": "Candidate Information",
+    "full_name": "Full Name",
+    "email": "Email",
+    "phone": "Phone Number",
+    "experience": "Years of Experience",
+    "position": "Desired Position",
+    "location": "Current Location",
+    "tech_stack": "Tech Stack (e.g., Python, TensorFlow, PostgreSQL)",
+    "proceed": "Proceed to Interview",
+    "missing_fields": "Please fill in all required fields.",
+    "invalid_tech_stack": "Please enter a valid tech stack!",
+    "generating_questions": "Generating questions...",
+    "no_questions": "Unable to generate questions.",
+    "question": "Question",
+    "your_answer": "Your Answer:",
+    "submit_answer": "Submit Answer",
+    "empty_answer": "Please enter a valid answer before proceeding.",
+    "completed": "✅ Interview completed! Your responses have been saved. We will contact you for further steps.",
+    "your_responses": "Your Responses:",
+    "start_new": "Start New Interview",
+    "show_saved": "Show all saved candidates (Admin View)",
+    "saved_data": "Saved Candidate Data:",
+    "no_data": "No candidate data available yet.",
+    "col_candidate": "Candidate",
+    "col_email": "Email",
+    "col_position": "Position",
+    "col_tech_stack": "Tech Stack",
+    "col_completed": "Completed",
+}
+
+# Translate every static string in one batch per language, shared across reruns and sessions
+@st.cache_resource(show_spinner=False)
+def build_translations(lang):
+    if lang == "en":
+        return dict(STATIC_STRINGS)
+    return dict(zip(STATIC_STRINGS, _translate_batch(list(STATIC_STRINGS.values()), lang)))
+
+def get_translations(lang):
     try:
-        translated = translator.translate(text, dest=target_lang)
-        return translated.text
+        return build_translations(lang)
     except Exception:
-        return text
+        return STATIC_STRINGS
 
-# Sentiment Analysis Function
-def analyze_sentiment(text):
-    analysis = TextBlob(text)
-    polarity = analysis.sentiment.polarity
+T = get_translations(st.session_state.preferred_language)
+
+# Sentiment lexicon: word -> (polarity, intensity, is_modifier), averaged over all senses as TextBlob does,
+# built once per process from TextBlob's en-sentiment.xml. Adverb (RB) senses mark modifiers like "very".
+def build_sentiment_lexicon():
+    from textblob.en import sentiment as pattern_sentiment
+    return {
+        word: (senses[None][0], senses[None][2], "RB" in senses)
+        for word, senses in pattern_sentiment.items()
+    }
+
+NEGATIONS = ("no", "not", "never", "n't")
+# Words, with contractions split like TextBlob's tokenizer ("don't" -> "do", "n't")
+WORD_PATTERN = re.compile(r"\w+(?=n't)|n't|\w+(?:'\w+)?")
+
+# Sentiment Analysis Function (mirrors TextBlob's PatternAnalyzer assessments without POS tagging)
+def analyze_sentiment(text, lexicon):
+    if not text.strip():
+        return "😐 Neutral"
+    assessments = []  # [polarity, intensity, negated] per scored word or modifier phrase
+    modifier = None  # Preceding known modifier ("very good")
+    negation = None  # Preceding negation ("not good")
+    for word in WORD_PATTERN.findall(text.lower()):
+        entry = lexicon.get(word)
+        if entry is not None:
+            polarity, intensity, is_modifier = entry
+            if modifier is None:
+                assessments.append([polarity, intensity, False])
+            else:
+                # Scale by the modifier's intensity instead of adding the modifier's own score
+                assessments[-1][0] = max(-1.0, min(polarity * assessments[-1][1], 1.0))
+                assessments[-1][1] = intensity
+            if negation is not None:
+                assessments[-1][1] = 1.0 / (assessments[-1][1] or 1)
+                assessments[-1][2] = True
+            modifier = word if is_modifier else None
+            negation = word if word in NEGATIONS else None
+        else:
+            if word in NEGATIONS:
+                negation = word
+            # Keep a negation across small words ("not a good")
+            elif negation and len(word.strip("'")) > 1:
+                negation = None
+            # Negation after a modifier ("really not good")
+            if negation is not None and modifier is not None:
+                assessments[-1][2] = True
+                negation = None
+            # Keep a modifier across small words ("very a good")
+            elif modifier and len(word) > 2:
+                modifier = None
+    # "not good" = slightly bad, "not bad" = slightly good; only the sign of the mean matters
+    polarity = sum(p * -0.5 if negated else p for p, _, negated in assessments)
     if polarity > 0:
         return "🙂 Positive"
     elif polarity < 0:
@@ -78,39 +248,78 @@ def analyze_sentiment(text):
     else:
         return "😐 Neutral"
 
-# Tech Stack Validation
+# Thread pool for answer post-processing, shared across reruns and sessions
+@st.cache_resource
+def get_executor():
+    return ThreadPoolExecutor(max_workers=4)
+
+# Translate an answer to English and score its sentiment (runs off the request path, so no Streamlit calls here)
+# translator is None for English sessions, which need no translation
+def process_answer(translator, lexicon_future, answer):
+    translated_answer = answer
+    if translator is not None:
+        try:
+            translated_answer = translator.translate(answer, dest="en").text
+        except Exception:
+            pass
+    return translated_answer, analyze_sentiment(translated_answer, lexicon_future.result())
+
+# Start building the lexicon on the executor (textblob import + XML parse) and share the future per process,
+# so neither first paint nor the first answer submit waits on it
+@st.cache_resource
+def load_sentiment_lexicon():
+    return get_executor().submit(build_sentiment_lexicon)
+
+# Tech Stack Validation (all keywords matched in a single regex pass)
+VALID_TECH_KEYWORDS = ["python", "java", "c++", "tensorflow", "react", "node.js", "pandas", "sql"]
+TECH_STACK_PATTERN = re.compile("|".join(map(re.escape, VALID_TECH_KEYWORDS)), re.IGNORECASE)
+
 def validate_tech_stack(stack):
-    valid_tech_keywords = ["python", "java", "c++", "tensorflow", "react", "node.js", "pandas", "sql"]
-    stack_lower = stack.lower()
-    return any(tech in stack_lower for tech in valid_tech_keywords)
+    return TECH_STACK_PATTERN.search(stack) is not None
+
+# LLM call and JSON parse (cached per tech stack; malformed output raises, so it is never cached)
+@st.cache_data(show_spinner=False, ttl=3600)
+def _generate_question_list(tech_stack):
+    prompt = (
+        f"Generate 5 interview questions for a candidate skilled in {tech_stack}. "
+        'Respond with JSON only, in the form {"questions": ["...", "...", "...", "...", "..."]}.'
+    )
+    response = get_llm().invoke(prompt).content
+    # Ignore any markdown code fence the model wraps around the JSON object
+    payload = response[response.index("{"):response.rindex("}") + 1]
+    questions = [q.strip() for q in orjson.loads(payload)["questions"] if q.strip()]
+    if not questions:
+        raise ValueError("LLM response contained no questions")
+    return questions[:5]
 
 # Function to generate interview questions based on tech stack
-def generate_questions(tech_stack):
+def generate_questions(tech_stack, target_lang="en"):
     if not validate_tech_stack(tech_stack):
-        return [translate_text("Please enter a valid tech stack!", st.session_state.preferred_language)]
-    
-    prompt = f"Generate 5 interview questions for a candidate skilled in {tech_stack}."
-    response = llm.invoke(prompt)
-    questions = [q.strip() for q in response.content.split("\n") if q.strip()]
-    return questions[:5] if questions else [translate_text("Unable to generate questions.", st.session_state.preferred_language)]
+        return [get_translations(target_lang)["invalid_tech_stack"]]
+    try:
+        with st.spinner(get_translations(target_lang)["generating_questions"]):
+            return _generate_question_list(tech_stack)
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return [get_translations(target_lang)["no_questions"]]
 
-# Step 1: Gather Candidate Info
-if not st.session_state.interview_started:
+# Step 1: Gather Candidate Info (a fragment, so validation warnings only rerun the form)
+@st.fragment
+def candidate_info_step():
     with st.form("candidate_info_form"):
-        st.subheader("📋 " + translate_text("Candidate Information", st.session_state.preferred_language))
-        full_name = st.text_input(translate_text("Full Name", st.session_state.preferred_language))
-        email = st.text_input(translate_text("Email", st.session_state.preferred_language))
-        phone = st.text_input(translate_text("Phone Number", st.session_state.preferred_language))
-        experience = st.number_input(translate_text("Years of Experience", st.session_state.preferred_language), min_value=0, max_value=50, step=1)
-        position = st.text_input(translate_text("Desired Position", st.session_state.preferred_language))
-        location = st.text_input(translate_text("Current Location", st.session_state.preferred_language))
-        tech_stack = st.text_area(translate_text("Tech Stack (e.g., Python, TensorFlow, PostgreSQL)", st.session_state.preferred_language))
+        st.subheader("📋 " + T["candidate_information"])
+        full_name = st.text_input(T["full_name"])
+        email = st.text_input(T["email"])
+        phone = st.text_input(T["phone"])
+        experience = st.number_input(T["experience"], min_value=0, max_value=50, step=1)
+        position = st.text_input(T["position"])
+        location = st.text_input(T["location"])
+        tech_stack = st.text_area(T["tech_stack"])
 
-        submit_info = st.form_submit_button(translate_text("Proceed to Interview", st.session_state.preferred_language))
+        submit_info = st.form_submit_button(T["proceed"])
 
     if submit_info:
         if not full_name or not email or not phone or not tech_stack:
-            st.warning(translate_text("Please fill in all required fields.", st.session_state.preferred_language))
+            st.warning(T["missing_fields"])
         else:
             st.session_state.candidate_info = {
                 "name": full_name,
@@ -121,87 +330,121 @@ if not st.session_state.interview_started:
                 "location": location,
                 "tech_stack": tech_stack,
             }
-            st.session_state.questions = generate_questions(tech_stack)
+            st.session_state.questions = generate_questions(tech_stack, st.session_state.preferred_language)
             st.session_state.question_index = 0
             st.session_state.conversation = []
             st.session_state.interview_started = True
+            load_sentiment_lexicon()  # Warm the lexicon in the background while the candidate answers
             st.session_state.current_answer = ""
+            st.session_state.interview_saved = False
             st.success(translate_text(f"Thank you, {full_name}! Let's start your interview.", st.session_state.preferred_language))
             st.rerun()
 
-# Step 2: Interview Process
-if st.session_state.interview_started and st.session_state.questions:
+# Step 2: Interview Process (a fragment, so submitting an answer only reruns the question block)
+@st.fragment
+def interview_step():
     index = st.session_state.question_index
 
-    if index < len(st.session_state.questions):
-        question = translate_text(st.session_state.questions[index], st.session_state.preferred_language)
-        
-        st.subheader(f"📝 {translate_text('Question', st.session_state.preferred_language)} {index + 1} of {len(st.session_state.questions)}:")
-        st.write(question)
-
-        # Single answer input tied to session state
-        st.session_state.current_answer = st.text_area(
-            translate_text("Your Answer:", st.session_state.preferred_language),
-            value=st.session_state.current_answer,
-            key=f"answer_{index}"
-        )
+    question = translate_text(st.session_state.questions[index], st.session_state.preferred_language)
+    
+    st.subheader(f"📝 {T['question']} {index + 1} of {len(st.session_state.questions)}:")
+    st.write(question)
+
+    # Single answer input tied to session state
+    st.session_state.current_answer = st.text_area(
+        T["your_answer"],
+        value=st.session_state.current_answer,
+        key=f"answer_{index}"
+    )
+
+    # Submit button
+    if st.button(T["submit_answer"], key=f"submit_{index}"):
+        if not st.session_state.current_answer.strip():
+            st.warning(T["empty_answer"])
+        else:
+            # Translation and sentiment run in the background; results are collected once the interview ends.
+            # The translator is only created (and googletrans imported) for non-English sessions.
+            translator = get_translator() if st.session_state.preferred_language != "en" else None
+            pending = get_executor().submit(
+                process_answer,
+                translator,
+                load_sentiment_lexicon(),
+                st.session_state.current_answer,
+            )
 
-        # Submit button
-        if st.button(translate_text("Submit Answer", st.session_state.preferred_language), key=f"submit_{index}"):
-            if not st.session_state.current_answer.strip():
-                st.warning(translate_text("Please enter a valid answer before proceeding.", st.session_state.preferred_language))
+            st.session_state.conversation.append({
+                "question": st.session_state.questions[index],
+                "answer_original": st.session_state.current_answer,
+                "pending": pending,
+            })
+            st.session_state.question_index += 1
+            st.session_state.current_answer = ""
+            # Only the last answer needs a full rerun, to show the completed view
+            if st.session_state.question_index < len(st.session_state.questions):
+                st.rerun(scope="fragment")
             else:
-                translated_answer = translate_text(st.session_state.current_answer, "en")
-                sentiment = analyze_sentiment(translated_answer)
-
-                st.session_state.conversation.append({
-                    "question": st.session_state.questions[index],
-                    "answer": translated_answer,
-                    "sentiment": sentiment
-                })
-                st.session_state.question_index += 1
-                st.session_state.current_answer = ""
                 st.rerun()
+
+# Render the current step
+if not st.session_state.interview_started:
+    candidate_info_step()
+
+if st.session_state.interview_started and st.session_state.questions:
+    if st.session_state.question_index < len(st.session_state.questions):
+        interview_step()
     else:
-        # Interview completed - Save to JSON
-        candidate_data = load_data()
-        candidate_id = st.session_state.candidate_info["email"]  # Using email as unique identifier
-        candidate_data[candidate_id] = {
-            "info": st.session_state.candidate_info,
-            "interview": st.session_state.conversation,
-            "completed_date": "March 16, 2025"  # Current date as per your instruction
-        }
-        save_data(candidate_data)
-
-        st.success(translate_text("✅ Interview completed! Your responses have been saved. We will contact you for further steps.", st.session_state.preferred_language))
-        st.subheader(translate_text("Your Responses:", st.session_state.preferred_language))
+        # Interview completed - Collect the background answer processing
+        for qa in st.session_state.conversation:
+            if "pending" in qa:
+                qa["answer"], qa["sentiment"] = qa.pop("pending").result()
+
+        # Append to JSON Lines (once, not on every rerun)
+        if not st.session_state.interview_saved:
+            append_candidate({
+                "info": st.session_state.candidate_info,  # Email is used as the unique identifier on load
+                "interview": st.session_state.conversation,
+                "completed_date": "March 16, 2025"  # Current date as per your instruction
+            })
+            st.session_state.interview_saved = True
+            _load_data_cached.clear()
+
+        # Translate every question in one batch; answers are shown as the candidate wrote them
+        translated_questions = translate_many(
+            [qa["question"] for qa in st.session_state.conversation],
+            st.session_state.preferred_language,
+        )
+
+        st.success(T["completed"])
+        st.subheader(T["your_responses"])
         
         for idx, qa in enumerate(st.session_state.conversation):
-            st.write(f"**Q{idx+1}:** {translate_text(qa['question'], st.session_state.preferred_language)}")
-            st.write(f"**A{idx+1}:** {translate_text(qa['answer'], st.session_state.preferred_language)}")
+            st.write(f"**Q{idx+1}:** {translated_questions[idx]}")
+            st.write(f"**A{idx+1}:** {qa['answer_original']}")
             st.write(f"**Sentiment:** {qa['sentiment']}")
             st.write("---")
 
         # Option to restart
-        if st.button(translate_text("Start New Interview", st.session_state.preferred_language)):
+        if st.button(T["start_new"]):
             st.session_state.interview_started = False
             st.session_state.conversation = []
             st.session_state.questions = []
             st.session_state.question_index = 0
             st.session_state.candidate_info = {}
             st.session_state.current_answer = ""
+            st.session_state.interview_saved = False
             st.rerun()
 
 # Optional: Display all saved candidates (for admin view)
-if st.checkbox(translate_text("Show all saved candidates (Admin View)", st.session_state.preferred_language)):
+if st.checkbox(T["show_saved"]):
     candidate_data = load_data()
     if candidate_data:
-        st.subheader(translate_text("Saved Candidate Data:", st.session_state.preferred_language))
-        for email, data in candidate_data.items():
-            st.write(f"**Candidate:** {data['info']['name']} ({email})")
-            st.write(f"**Position:** {data['info']['position']}")
-            st.write(f"**Tech Stack:** {data['info']['tech_stack']}")
-            st.write(f"**Completed:** {data['completed_date']}")
-            st.write("---")
+        st.subheader(T["saved_data"])
+        rows = [
+            (data["info"]["name"], email, data["info"]["position"], data["info"]["tech_stack"], data["completed_date"])
+            for email, data in candidate_data.items()
+        ]
+        # Render the whole table at once instead of one st.write per field
+        headers = [T[key] for key in ("col_candidate", "col_email", "col_position", "col_tech_stack", "col_completed")]
+        st.dataframe(dict(zip(headers, zip(*rows))), hide_index=True, use_container_width=True)
     else:
-        st.write(translate_text("No candidate data available yet.", st.session_state.preferred_language))
\ No newline at end of file
+        st.write(T["no_data"])